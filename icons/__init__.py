@@ -0,0 +1,4 @@
+"""App icon generator; see styles.py for the individual icon styles."""
+from .styles import main
+
+__all__ = ['main']
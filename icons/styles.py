@@ -0,0 +1,527 @@
+"""Render every app icon style from one process.
+
+Each style is a SPECS entry (colors, size, fonts) drawn by its draw_<style>
+function and written out according to OUTPUTS. get_font() opens each
+(path, size) once and shares it between styles. Run it as `python -m icons`;
+the create_*_icon.py scripts are thin wrappers around main() for the
+individual styles.
+"""
+from PIL import Image, ImageDraw, ImageFilter
+from .cache import BOLD_MONOSPACE_FONTS, MONOSPACE_FONTS, emit_sizes, find_font, get_font, render_master, save_png
+import argparse
+import functools
+import numpy as np
+import os
+
+# Anthropic/Claude orange color
+CLAUDE_ORANGE = (235, 140, 85, 255)  # #EB8C55
+WHITE = (255, 255, 255, 255)
+LIGHT_GRAY = (224, 224, 224, 255)  # #e0e0e0
+DARK_BG = (26, 26, 26, 255)  # #1a1a1a
+TERMINAL_BG = (42, 42, 42, 255)  # #2a2a2a
+
+# Probed once for every style
+MONOSPACE_FONT = find_font(MONOSPACE_FONTS)
+BOLD_MONOSPACE_FONT = next(((path, index) for path, index in BOLD_MONOSPACE_FONTS if os.path.exists(path)),
+                           (None, 0))
+
+# Drawing parameters per style; every entry feeds the render cache key
+SPECS = {
+    'basic': {
+        'size': 512,
+        'background': DARK_BG,
+        'font_path': find_font(["/System/Library/Fonts/Monaco.dfont"]),
+        'title_font_path': find_font(["/System/Library/Fonts/Helvetica.ttc"]),
+    },
+    'terminal': {
+        'size': 512,
+        'background': DARK_BG,  # Use the same background color as the app (#1a1a1a)
+        'terminal': TERMINAL_BG,
+        'prompt': LIGHT_GRAY,
+        'cursor': CLAUDE_ORANGE,
+        'font_path': MONOSPACE_FONT,
+        'cursor_font_path': BOLD_MONOSPACE_FONT[0],
+        'cursor_font_index': BOLD_MONOSPACE_FONT[1],
+    },
+    'overview': {
+        'size': 512,
+        'background': DARK_BG,
+        'active': (74, 158, 255, 255),
+        'inactive': TERMINAL_BG,
+    },
+    'modern': {
+        'size': 512,
+        'background': CLAUDE_ORANGE,
+        'foreground': WHITE,
+        'font_path': MONOSPACE_FONT,
+    },
+    'full': {
+        'size': 1024,  # macOS prefers 1024x1024 for the source icon
+        'background': CLAUDE_ORANGE,
+        'foreground': WHITE,
+        'font_path': MONOSPACE_FONT,
+    },
+    'final': {
+        'size': 1024,  # macOS prefers 1024x1024 for the source icon
+        'background': CLAUDE_ORANGE,
+        'foreground': WHITE,
+        'font_path': MONOSPACE_FONT,
+    },
+}
+
+# Where each style writes its size variants, plus extra copies by size
+OUTPUTS = {
+    'basic': {
+        'sizes': [256, 128, 64, 32, 16],
+        'pattern': 'assets/icon_{}.png',
+        'copies': {'assets/icon.png': 512},
+    },
+    'terminal': {
+        'sizes': [256, 128, 64, 32, 16],
+        'pattern': 'assets/icon_{}.png',
+        'copies': {'assets/icon.png': 512},
+    },
+    'overview': {
+        'sizes': [256, 128, 64, 32, 16],
+        'pattern': 'assets/overview_icon_{}.png',
+        'copies': {'assets/overview_icon.png': 512, 'assets/icon.png': 512},
+    },
+    'modern': {
+        'sizes': [256, 128, 64, 32, 16],
+        'pattern': 'assets/icon_{}.png',
+        'copies': {'assets/icon.png': 512},
+    },
+    'full': {
+        'sizes': [1024, 512, 256, 128, 64, 32, 16],
+        'pattern': 'assets/icon_{}.png',
+        'copies': {'assets/icon.png': 512},
+    },
+    'final': {
+        'sizes': [1024, 512, 256, 128, 64, 32, 16],
+        'pattern': 'assets/icon_{}.png',
+        'copies': {'assets/icon.png': 512},
+    },
+}
+
+FEATURES = {
+    'terminal': [
+        "Terminal window with >_ prompt",
+        "> in light gray (#e0e0e0)",
+        "_ cursor in Anthropic orange (#EB8C55)",
+        "Background matches app (#1a1a1a)",
+        "Project dots below with first one highlighted",
+    ],
+    'modern': [
+        "Full orange background (Anthropic brand color)",
+        "Large >_ symbol in white",
+        "Rounded corners like modern apps (Slack, Discord)",
+        "No dark border or container",
+        "Maximum visibility and recognition",
+    ],
+    'full': [
+        "FULL orange background - no dark container",
+        "Large white >_ symbol",
+        "Fills entire icon space like Slack/Discord",
+        "High contrast for dock visibility",
+    ],
+    'final': [
+        "Orange background with standard macOS rounded corners (22.5% radius)",
+        "MUCH larger > symbol (600pt font)",
+        "Bold, thick underscore cursor (500pt font)",
+        "Professional app appearance like Slack/Discord",
+        "Subtle depth with inner highlight",
+    ],
+}
+
+def arc_highlight(size, start, end, depth, alpha):
+    """White layer fading inward from the inscribed circle between two angles.
+
+    Angles follow ImageDraw.arc: degrees clockwise from 3 o'clock.
+    """
+    center = size / 2
+    yy, xx = np.ogrid[:size, :size]
+    dy, dx = yy + 0.5 - center, xx + 0.5 - center
+    inset = center - np.hypot(dx, dy)
+    angle = np.degrees(np.arctan2(dy, dx)) % 360
+
+    fade = np.interp(inset, [0, depth], [alpha, 0])
+    visible = (inset >= 0) & (angle >= start) & (angle <= end)
+
+    layer = np.full((size, size, 4), 255, np.uint8)
+    layer[..., 3] = np.where(visible, fade, 0)
+    return Image.fromarray(layer)
+
+def draw_basic(spec):
+    size = spec['size']
+    img = Image.new('RGBA', (size, size), spec['background'])
+    draw = ImageDraw.Draw(img)
+
+    # Draw terminal window
+    terminal_color = (42, 42, 42, 255)
+    draw.rounded_rectangle((80, 140, 432, 372), 8, fill=terminal_color)
+
+    # Draw terminal header
+    header_color = (51, 51, 51, 255)
+    draw.rectangle([(80, 140), (432, 172)], fill=header_color)
+
+    # Draw window controls
+    draw.ellipse([(98, 150), (110, 162)], fill=(255, 95, 86, 255))  # Red
+    draw.ellipse([(118, 150), (130, 162)], fill=(255, 189, 46, 255))  # Yellow
+    draw.ellipse([(138, 150), (150, 162)], fill=(39, 201, 63, 255))  # Green
+
+    # Draw "Claude >" text effect with a monospace font if available
+    font = get_font(spec['font_path'], 28)
+
+    # Draw text with a blue color
+    text_color = (74, 158, 255, 255)
+    draw.text((100, 200), "claude", fill=text_color, font=font)
+    draw.text((180, 200), ">", fill=(224, 224, 224, 255), font=font)
+
+    # Draw cursor
+    draw.rectangle([(200, 195), (216, 215)], fill=(74, 158, 255, 200))
+
+    # Draw grid dots for projects
+    for i in range(3):
+        for j in range(3):
+            x = 120 + i * 20
+            y = 280 + j * 20
+            color = (74, 158, 255, 255) if i == 0 and j == 0 else (102, 102, 102, 255)
+            draw.ellipse([(x-4, y-4), (x+4, y+4)], fill=color)
+
+    # Draw "Dashboard" text
+    title_font = get_font(spec['title_font_path'], 42)
+
+    draw.text((256, 280), "Dashboard", fill=(224, 224, 224, 255), font=title_font, anchor="mm")
+
+    return img
+
+def draw_terminal(spec):
+    size = spec['size']
+    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))  # Transparent background
+    draw = ImageDraw.Draw(img)
+
+    # Main background with app color
+    draw.rounded_rectangle((32, 32, 480, 480), 48, fill=spec['background'])
+
+    # Create central terminal window
+    terminal_width = 380
+    terminal_height = 260
+    terminal_x = (size - terminal_width) // 2
+    terminal_y = (size - terminal_height) // 2 - 20
+
+    # Terminal window background
+    draw.rounded_rectangle(
+        (terminal_x, terminal_y, terminal_x + terminal_width, terminal_y + terminal_height), 
+        16, fill=spec['terminal'])
+
+    # Terminal header bar with only the top corners rounded
+    header_height = 40
+    draw.rounded_rectangle(
+        (terminal_x, terminal_y, terminal_x + terminal_width, terminal_y + header_height), 
+        16, fill=(51, 51, 51, 255), corners=(True, True, False, False))
+
+    # Window control dots
+    dot_y = terminal_y + 20
+    dot_colors = [
+        (255, 95, 86, 255),   # Red
+        (255, 189, 46, 255),  # Yellow
+        (39, 201, 63, 255)    # Green
+    ]
+    for i, color in enumerate(dot_colors):
+        dot_x = terminal_x + 20 + i * 20
+        draw.ellipse([(dot_x - 6, dot_y - 6), (dot_x + 6, dot_y + 6)], fill=color)
+
+    # Terminal prompt area
+    prompt_y = terminal_y + terminal_height // 2
+
+    # Load a monospace font
+    font = get_font(spec['font_path'], 80)
+
+    # Draw the prompt >_
+    prompt_x = terminal_x + 60
+
+    # Draw > in light gray
+    draw.text((prompt_x, prompt_y), ">", fill=spec['prompt'], font=font, anchor="lm")
+
+    # Draw _ (underscore/cursor) in Claude orange with slight offset, using a
+    # bold face when one is installed and a 1px stroke otherwise
+    cursor_x = prompt_x + 70
+    if spec['cursor_font_path']:
+        cursor_font = get_font(spec['cursor_font_path'], 80, spec['cursor_font_index'])
+        draw.text((cursor_x, prompt_y + 5), "_", fill=spec['cursor'], font=cursor_font, anchor="lm")
+    else:
+        draw.text((cursor_x + 1, prompt_y + 5), "_", fill=spec['cursor'], font=font, anchor="lm",
+                  stroke_width=1, stroke_fill=spec['cursor'])
+
+    # Add subtle grid dots below to represent projects
+    grid_y = terminal_y + terminal_height + 40
+    dot_size = 8
+    dot_spacing = 24
+
+    # Center the grid
+    grid_width = 5 * dot_spacing
+    grid_start_x = (size - grid_width) // 2
+
+    for i in range(6):
+        dot_x = grid_start_x + i * dot_spacing
+        # Make first dot orange (active project)
+        color = spec['cursor'] if i == 0 else (102, 102, 102, 180)
+        draw.ellipse(
+            [(dot_x - dot_size//2, grid_y - dot_size//2), 
+             (dot_x + dot_size//2, grid_y + dot_size//2)], 
+            fill=color)
+
+    return img
+
+def blend(region, src):
+    """Alpha-blend the float RGBA src over region in place"""
+    src_alpha = src[..., 3:] / 255
+    dst_alpha = region[..., 3:] / 255
+    out_alpha = src_alpha + dst_alpha * (1 - src_alpha)
+    rgb = (src[..., :3] * src_alpha + region[..., :3] * dst_alpha * (1 - src_alpha)) / np.maximum(out_alpha, 1e-6)
+    region[...] = np.concatenate([rgb, out_alpha * 255], axis=-1)
+
+def composite(buf, box, mask, color):
+    """Alpha-blend color over the float RGBA buf inside box wherever mask is set"""
+    x0, y0, x1, y1 = box
+    src = np.zeros(mask.shape + (4,), np.float32)
+    src[mask] = color
+    blend(buf[y0:y1 + 1, x0:x1 + 1], src)
+
+@functools.lru_cache(maxsize=None)
+def corner_mask(radius):
+    """Top-left quadrant of a rounded corner; the 0.4px slack reproduces Pillow's rasterization"""
+    yy, xx = np.ogrid[-radius:0, -radius:0]
+    mask = xx ** 2 + yy ** 2 <= (radius + 0.4) ** 2
+    mask.flags.writeable = False
+    return mask
+
+def fill_rounded_rectangle(buf, xy, radius, color):
+    """NumPy counterpart of ImageDraw.rounded_rectangle that blends instead of overwriting"""
+    x0, y0, x1, y1 = xy
+    mask = np.ones((y1 - y0 + 1, x1 - x0 + 1), bool)
+    if radius:
+        # Stamp the cached quadrant into each corner, mirrored as needed
+        corner = corner_mask(radius)
+        mask[:radius, :radius] = corner
+        mask[:radius, -radius:] = corner[:, ::-1]
+        mask[-radius:, :radius] = corner[::-1]
+        mask[-radius:, -radius:] = corner[::-1, ::-1]
+    composite(buf, xy, mask, color)
+
+def rounded_canvas(size, radius, color):
+    """Square canvas filled with an opaque color, with transparent rounded corners.
+
+    Matches rounded_rectangle((0, 0, size, size)) on a transparent image, but the
+    fill comes straight from Image.new and the shape is only drawn into the
+    single-band alpha.
+    """
+    img = Image.new('RGBA', (size, size), color)
+    alpha = Image.new('L', (size, size), 0)
+    ImageDraw.Draw(alpha).rounded_rectangle((0, 0, size, size), radius, fill=255)
+    img.putalpha(alpha)
+    return img
+
+def fill_ellipse(buf, xy, color):
+    """NumPy counterpart of ImageDraw.ellipse that blends instead of overwriting"""
+    x0, y0, x1, y1 = xy
+    yy, xx = np.ogrid[y0:y1 + 1, x0:x1 + 1]
+    cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+    rx, ry = (x1 - x0) / 2 + 0.4, (y1 - y0) / 2 + 0.4
+    composite(buf, xy, ((xx - cx) / rx) ** 2 + ((yy - cy) / ry) ** 2 <= 1, color)
+
+def draw_overview(spec):
+    size = spec['size']
+    # Shapes only, no text, so the whole icon is drawn straight into a NumPy buffer
+    buf = np.zeros((size, size, 4), np.float32)  # Transparent background
+
+    # Main background
+    fill_rounded_rectangle(buf, (32, 32, 480, 480), 48, spec['background'])
+
+    # Create 3x3 grid of project squares
+    grid_size = 3
+    square_size = 100
+    spacing = 24
+    start_x = (size - (grid_size * square_size + (grid_size - 1) * spacing)) // 2
+    start_y = (size - (grid_size * square_size + (grid_size - 1) * spacing)) // 2
+
+    active_rgb = spec['active'][:3]
+
+    # Inactive squares all look the same: render one tile and blend copies of it
+    inactive_tile = np.zeros((square_size + 1, square_size + 1, 4), np.float32)
+    fill_rounded_rectangle(inactive_tile, (0, 0, square_size, square_size), 8, spec['inactive'])
+
+    # Subtle inner border
+    inner_margin = 2
+    fill_rounded_rectangle(inactive_tile, 
+        (inner_margin, inner_margin, square_size - inner_margin, square_size - inner_margin), 
+        6, (51, 51, 51, 255))
+
+    for row in range(grid_size):
+        for col in range(grid_size):
+            x = start_x + col * (square_size + spacing)
+            y = start_y + row * (square_size + spacing)
+            
+            # Highlight the top-left square (active project)
+            if row == 0 and col == 0:
+                # Glowing effect - blur the square's silhouette and blend it underneath
+                glow_radius = 10
+                pad = 3 * glow_radius
+                glow_mask = Image.new('L', (square_size + 1 + 2 * pad,) * 2, 0)
+                ImageDraw.Draw(glow_mask).rounded_rectangle(
+                    (pad, pad, pad + square_size, pad + square_size), 8, fill=180)
+                glow_mask = glow_mask.filter(ImageFilter.GaussianBlur(radius=glow_radius))
+                glow = np.empty(glow_mask.size[::-1] + (4,), np.float32)
+                glow[..., :3] = active_rgb
+                glow[..., 3] = np.asarray(glow_mask)
+                blend(buf[y - pad:y + square_size + 1 + pad, x - pad:x + square_size + 1 + pad], glow)
+                
+                # Main active square
+                fill_rounded_rectangle(buf, (x, y, x + square_size, y + square_size), 8, spec['active'])
+                
+                # Inner glow effect
+                inner_margin = 12
+                fill_rounded_rectangle(buf, 
+                    (x + inner_margin, y + inner_margin, 
+                     x + square_size - inner_margin, y + square_size - inner_margin), 
+                    4, (107, 183, 255, 180))
+            else:
+                blend(buf[y:y + square_size + 1, x:x + square_size + 1], inactive_tile)
+
+    # Add small indicator dots in the active square (representing terminal, preview, etc)
+    active_x = start_x
+    active_y = start_y
+    dot_y = active_y + square_size - 20
+
+    for i in range(3):
+        dot_x = active_x + 25 + i * 25
+        fill_ellipse(buf, (dot_x - 4, dot_y - 4, dot_x + 4, dot_y + 4), 
+                     (255, 255, 255, 200 if i == 1 else 120))
+
+    return Image.fromarray(buf.round().astype(np.uint8))
+
+def draw_modern(spec):
+    size = spec['size']
+
+    # Main background - full orange with rounded corners (like Slack)
+    img = rounded_canvas(size, 90, spec['background'])
+    draw = ImageDraw.Draw(img)
+
+    # Make the font MUCH bigger
+    font = get_font(spec['font_path'], 220)
+
+    # Draw a large >_ in the center
+    # Position for centered layout
+    center_x = size // 2
+    center_y = size // 2
+
+    # Draw > in white
+    draw.text((center_x - 120, center_y - 20), ">", fill=spec['foreground'], font=font, anchor="mm")
+
+    # Draw _ (underscore) in white, slightly offset to the right and stroked to make it thicker
+    draw.text((center_x + 42, center_y + 20), "_", fill=spec['foreground'], font=font,
+              anchor="mm", stroke_width=2, stroke_fill=spec['foreground'])
+
+    # Add a subtle inner shadow effect at the top, fading out over 3 rows
+    shadow = np.zeros((3, size - 179, 4), np.uint8)
+    shadow[..., :3] = (200, 100, 50)
+    shadow[..., 3] = np.linspace(30, 10, 3)[:, None]
+    img.alpha_composite(Image.fromarray(shadow), (90, 0))
+
+    return img
+
+def draw_full(spec):
+    size = spec['size']
+
+    # Create image with orange filling the entire space
+    img = Image.new('RGBA', (size, size), spec['background'])
+    draw = ImageDraw.Draw(img)
+
+    # Large font for visibility
+    font = get_font(spec['font_path'], 400)
+
+    # Draw a large >_ in the center
+    center_x = size // 2
+    center_y = size // 2
+
+    # Draw > in white
+    draw.text((center_x - 200, center_y - 40), ">", fill=spec['foreground'], font=font, anchor="mm")
+
+    # Draw _ (underscore) in white, stroked to make it bolder
+    draw.text((center_x + 84, center_y + 40), "_", fill=spec['foreground'], font=font,
+              anchor="mm", stroke_width=4, stroke_fill=spec['foreground'])
+
+    return img
+
+def draw_final(spec):
+    size = spec['size']
+
+    # Orange background with rounded corners (22.5% corner radius like iOS/macOS apps)
+    corner_radius = int(size * 0.225)  # Standard iOS/macOS corner radius
+    img = rounded_canvas(size, corner_radius, spec['background'])
+    draw = ImageDraw.Draw(img)
+
+    # MUCH bigger font for the > symbol, separate font for underscore. The glyphs
+    # are rasterized at full size on purpose: FreeType fills a 600pt outline in
+    # about a millisecond, whereas rendering small and LANCZOS-upscaling is ~10x
+    # slower and blurs the edges.
+    font = get_font(spec['font_path'], 600)
+    font_small = get_font(spec['font_path'], 500)
+
+    # Draw a large >_ in the center
+    center_x = size // 2
+    center_y = size // 2
+
+    # Draw > in white - positioned more to the left
+    draw.text((center_x - 250, center_y - 50), ">", fill=spec['foreground'], font=font, anchor="mm")
+
+    # Draw _ (underscore) in white - bigger and bolder
+    underscore_x = center_x + 120
+    underscore_y = center_y + 80
+
+    # Make the underscore much thicker with a stroke instead of restamping the glyph
+    draw.text((underscore_x + 4, underscore_y), "_", fill=spec['foreground'], font=font_small,
+              anchor="mm", stroke_width=6, stroke_fill=spec['foreground'])
+
+    # Add subtle depth with inner highlight along the top
+    img.alpha_composite(arc_highlight(size, 225, 315, depth=4, alpha=40))
+
+    return img
+
+DRAW_FUNCTIONS = {
+    'basic': draw_basic,
+    'terminal': draw_terminal,
+    'overview': draw_overview,
+    'modern': draw_modern,
+    'full': draw_full,
+    'final': draw_final,
+}
+
+def render(style):
+    """Render one style and write all of its outputs"""
+    img = render_master(SPECS[style], DRAW_FUNCTIONS[style])
+
+    output = OUTPUTS[style]
+    sized = {img.width: img}
+    sized.update(emit_sizes(img, output['sizes'], output['pattern']))
+    for path, size in output['copies'].items():
+        save_png(sized[size], path)
+        print(f"Created: {path}")
+
+    if style in FEATURES:
+        print(f"\n{style.capitalize()} icon features:")
+        for feature in FEATURES[style]:
+            print(f"- {feature}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='icons', description="Generate the app icons")
+    parser.add_argument('--style', choices=list(SPECS) + ['all'], default='all',
+                        help="icon style to render (default: all, final last)")
+    parser.add_argument('--all', dest='style', action='store_const', const='all',
+                        help="render every style, same as --style all")
+    args = parser.parse_args(argv)
+
+    styles = list(SPECS) if args.style == 'all' else [args.style]
+    os.makedirs('assets', exist_ok=True)
+    for style in styles:
+        render(style)
@@ -0,0 +1,14 @@
+#!/bin/bash
+
+# Recompress the generated icons once before committing them.
+# The create_*_icon.py scripts save with fast zlib settings; oxipng's filter
+# search gets the checked-in files smaller than libpng ever would.
+
+if ! command -v oxipng >/dev/null 2>&1; then
+    echo "oxipng not found - install it with: brew install oxipng"
+    exit 1
+fi
+
+echo "Optimizing icons in assets/..."
+oxipng --opt 4 --strip safe --alpha assets/*.png
+echo "Done!"